@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import abc
+import itertools
 from ._version import NPM_PACKAGE_RANGE
 
 from ipywidgets import DOMWidget
@@ -17,21 +18,21 @@ Information about the frontend package of the ipywidgets.
 module_name = "jppype"
 module_version = "0.1.0"
 
+_instance_ids = itertools.count()
+
 
 class BaseI3PWidget(DOMWidget):
-    _model_module = Unicode(module_name).tag(sync=True)
-    _model_module_version = Unicode(module_version).tag(sync=True)
+    # Module names and versions are the same for every jppype widget: read-only spares the per-instance write path.
+    _model_module = Unicode(module_name, read_only=True).tag(sync=True)
+    _model_module_version = Unicode(module_version, read_only=True).tag(sync=True)
     _model_name = Unicode(f'MODEL_NAME').tag(sync=True)
-    _view_module = Unicode(module_name).tag(sync=True)
-    _view_module_version = Unicode(module_version).tag(sync=True)
+    _view_module = Unicode(module_name, read_only=True).tag(sync=True)
+    _view_module_version = Unicode(module_version, read_only=True).tag(sync=True)
     _view_name = Unicode(f'VIEW_NAME').tag(sync=True)
     _instance_id = Int(0).tag(sync=True)
 
-    __last_instance_id = 0
-
     def __init__(self):
-        self._instance_id = BaseI3PWidget.__last_instance_id
-        BaseI3PWidget.__last_instance_id += 1
+        self._instance_id = next(_instance_ids)
         super(BaseI3PWidget, self).__init__()
         self.on_msg(self._on_custom_msg_received)
 
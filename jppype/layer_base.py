@@ -3,25 +3,53 @@ from __future__ import annotations
 import abc
 import json
 from copy import copy
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Tuple, Dict, Protocol, Mapping, Iterable, Type, Literal, Callable, TypeGuard
 from uuid import uuid4
 
 from .utils import call_matching_params, Rect, Point, Transform, FitMode, FIT_OPTIONS, FIT_WIDTH
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ======================================================================================================================
 #   Utility class used by Layer and LayersList
 # ======================================================================================================================
 class LayerData:
+    __slots__ = ('data', 'type', 'infos')
+
     def __init__(self, data: any, infos: dict = None, type: str = None):
         self.data = data
         self.type = type
         self.infos = infos
 
     def to_json_bytes(self) -> bytes:
-        import json
-        return json.dumps(dict(data=self.data, type=self.type, infos=self.infos),
-                          indent=None, separators=(',', ':'), ensure_ascii=True).encode('ascii')
+        return json_dumps_bytes(dict(data=self.data, type=self.type, infos=self.infos))
+
+
+def _orjson_default(obj):
+    # orjson only serializes exact tuples, not subclasses such as Rect or Point.
+    if isinstance(obj, tuple):
+        return list(obj)
+    return _json_default(obj)
+
+
+def _json_default(obj):
+    # Numpy arrays and scalars (orjson serializes most of them natively).
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def json_dumps_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=None, separators=(',', ':'), ensure_ascii=True,
+                      default=_json_default).encode('ascii')
 
 
 class LayerDataChangeDispatcher(Protocol):
@@ -33,15 +61,15 @@ class LayerOptionsChangeDispatcher(Protocol):
 
 
 class DispatcherUnbind:
-    def __init__(self, dispatchers_dict, uuid):
-        self._dispatchers_dict = dispatchers_dict
-        self._uuid = uuid
+    __slots__ = ('_dispatchers_dicts', '_key')
+
+    def __init__(self, dispatchers_dicts: dict | tuple[dict, ...], key):
+        self._dispatchers_dicts = (dispatchers_dicts,) if isinstance(dispatchers_dicts, dict) else dispatchers_dicts
+        self._key = key
 
     def __call__(self):
-        try:
-            del self._dispatchers_dict[self._uuid]
-        except KeyError:
-            pass
+        for dispatchers_dict in self._dispatchers_dicts:
+            dispatchers_dict.pop(self._key, None)
 
 
 class LayerSelector(Protocol):
@@ -49,59 +77,111 @@ class LayerSelector(Protocol):
 
 
 class ContextLock:
-    def __init__(self, final_callback: Callable[[dict[str, set]], None]):
-        self._locked = False
-        self._flags: dict[str, set] = {}
+    __slots__ = ('locked', '_flags', '_final_callback', '_enter_count')
+
+    def __init__(self, final_callback: Callable[[dict[str, list]], None]):
+        # Plain attribute rather than a property: it is tested on every layer change event.
+        self.locked = False
+        self._flags: dict[str, list] = {}
         self._final_callback = final_callback
         self._enter_count = 0
 
     def __enter__(self):
-        self._locked = True
+        self.locked = True
         self._enter_count += 1
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._enter_count -= 1
 
         if self._enter_count == 0:
-            self._final_callback(self._flags)
+            # Flagged data is only deduplicated once, when the lock is released, keeping the emission order.
+            self._final_callback({flag: list(dict.fromkeys(data)) for flag, data in self._flags.items()})
             self._flags.clear()
-            self._locked = False
+            self.locked = False
 
     def add(self, flag: str, data = None):
-        if self._locked:
-            if flag not in self._flags:
-                self._flags[flag] = set()
+        if self.locked:
+            flag_data = self._flags.get(flag)
+            if flag_data is None:
+                flag_data = self._flags[flag] = []
             if data is not None:
-                self._flags[flag].add(data)
+                flag_data.append(data)
         return self
 
     def __contains__(self, item: str):
         return item in self._flags
 
     @property
-    def flags(self) -> dict[str, set]:
+    def flags(self) -> dict[str, list]:
         return self._flags
 
     def __bool__(self):
-        return self._locked
-
-    @property
-    def locked(self) -> bool:
-        return self._locked
+        return self.locked
 
 
 LayerDomain = Rect | FitMode
 DomainMode = Literal['manual'] | FitMode
 
 
+_FIT_MODES = frozenset(FIT_OPTIONS)
+
+
 def is_domain(value: any) -> TypeGuard[LayerDomain]:
-    return isinstance(value, (Rect, str)) or value in FIT_OPTIONS
+    return isinstance(value, Rect) or (isinstance(value, str) and value in _FIT_MODES)
+
+
+def _check_visible(v) -> bool:
+    if not isinstance(v, bool):
+        raise ValueError(f'visible must be a bool, got {v}')
+    return v
+
+
+def _check_opacity(v) -> float:
+    if not isinstance(v, (int, float)):
+        try:
+            v = float(v)
+        except (TypeError, ValueError):
+            raise ValueError(f'opacity must be a number between 0 and 1, got {v}') from None
+    if not 0 <= v <= 1:
+        raise ValueError(f'opacity must be a number between 0 and 1, got {v}')
+    return v
+
+
+def _check_label(v) -> str:
+    if not isinstance(v, str):
+        raise ValueError(f'label must be a string, got {v}')
+    return v
+
+
+def _check_z_index(v) -> float:
+    if not isinstance(v, (int, float)):
+        try:
+            v = float(v)
+        except (TypeError, ValueError):
+            raise ValueError(f'z_index must be a number, got {v}') from None
+    return v
+
+
+def _check_domain(v) -> Rect:
+    if not isinstance(v, (tuple, list)) or len(v) != 4 or not all(isinstance(x, (int, float)) for x in v):
+        raise ValueError(f'domain must be a tuple or list of 4 numbers, got {v}')
+    # Stored as a Rect so the domain getter doesn't rebuild it on every access.
+    return v if type(v) is Rect else Rect(*v)
 
 
 # ======================================================================================================================
 #   Layer base class
 # ======================================================================================================================
 class Layer(abc.ABC):
+    # Map each option name to a function returning the validated value or raising ValueError.
+    _options_validators: Dict[str, Callable[[any], any]] = {
+        'visible': _check_visible,
+        'opacity': _check_opacity,
+        'label': _check_label,
+        'z_index': _check_z_index,
+        'domain': _check_domain,
+    }
+
     def __init__(self, layer_type: str):
         self._options = {'visible': True,
                          'opacity': 1.0,
@@ -111,26 +191,42 @@ class Layer(abc.ABC):
                          'domain': Rect.empty()
                          }
         self._layer_type = layer_type
-        self._on_data_change: Dict[str, LayerDataChangeDispatcher] = {}
-        self._on_options_change: Dict[str, LayerOptionsChangeDispatcher] = {}
+        self._on_data_change: Dict[int, LayerDataChangeDispatcher] = {}
+        self._on_options_change: Dict[int, LayerOptionsChangeDispatcher] = {}
+        self._callbacks_count = 0
+        self._options_json: bytes | None = None
         self._main_domain = Rect.empty()
         self._domain_mode: DomainMode | None = None
-        self._uuid = uuid4()
-
-
+        self._renew_uuid()
 
     def duplicate(self):
-        layer = copy(self)
-        layer._uuid = uuid4()
+        return copy(self)
+
+    def __copy__(self):
+        layer = object.__new__(type(self))
+        layer.__dict__.update(self.__dict__)
+        # The duplicate must neither share options nor notify the original's subscribers.
+        layer._options = self._options.copy()
+        layer._options_json = None
+        layer._on_data_change = {}
+        layer._on_options_change = {}
+        layer._callbacks_count = 0
+        layer._renew_uuid()
         return layer
 
+    def _renew_uuid(self):
+        self._uuid = uuid4()
+        # uuid and __hash__ are hit on every dict lookup of the layers list: compute them once.
+        self._uuid_hex = self._uuid.hex
+        self._uuid_hash = hash(self._uuid)
+
     # --- Base properties ---
     @property
     def uuid(self) -> str:
-        return self._uuid.hex
+        return self._uuid_hex
 
     def __hash__(self):
-        return hash(self._uuid)
+        return self._uuid_hash
 
     def __eq__(self, other):
         return isinstance(other, Layer) and self._uuid == other._uuid
@@ -147,61 +243,34 @@ class Layer(abc.ABC):
     def shape(self) -> Tuple[int, int]:
         return self._shape()
 
+    def options_json(self) -> bytes:
+        """JSON encoding of the layer options, cached until the options change."""
+        if self._options_json is None:
+            self._options_json = json.dumps(self._options, ensure_ascii=False).encode('utf8')
+        return self._options_json
+
     # --- Options properties ---
     def set_options(self, options: Dict[str, any], raise_on_error: bool = True):
+        validators = self._options_validators
+        self._options_json = None
         for k, v in options.items():
-            match k:
-                case 'visible':
-                    if not isinstance(v, bool):
-                        if raise_on_error:
-                            raise ValueError(f'visible must be a bool, got {v}')
-                        else:
-                            continue
-                    self._options['visible'] = v
-
-                case 'opacity':
-                    if not isinstance(v, (int, float)):
-                        try:
-                            v = float(v)
-                        except ValueError:
-                            if raise_on_error:
-                                raise ValueError(f'opacity must be a number between 0 and 1, got {v}')
-                            else:
-                                continue
-                    if not 0 <= v <= 1:
-                        if raise_on_error:
-                            raise ValueError(f'opacity must be a number between 0 and 1, got {v}')
-                        else:
-                            continue
-                    self._options['opacity'] = v
-
-                case 'label':
-                    if not isinstance(v, str):
-                        if raise_on_error:
-                            raise ValueError(f'label must be a string, got {v}')
-                        else:
-                            continue
-                    self._options['label'] = v
-
-                case 'z_index':
-                    if not isinstance(v, (int, float)):
-                        try:
-                            v = float(v)
-                        except ValueError:
-                            if raise_on_error:
-                                raise ValueError(f'z_index must be a number, got {v}')
-                            else:
-                                continue
-                    self._options['z_index'] = v
-                case 'domain':
-                    if not isinstance(v, (tuple, list)) or len(v) != 4 \
-                       or not all(isinstance(x, (int, float)) for x in v):
-                        if raise_on_error:
-                            raise (ValueError(f'domain must be a tuple or list of 4 numbers, got {v}'))
-                        else:
-                            continue
-                    self._options['domain'] = tuple(v)
-        self._notify_options_change({k: self._options[k] for k in options.keys() if k in self._options})
+            validator = validators.get(k)
+            if validator is None:
+                continue
+            try:
+                self._options[k] = validator(v)
+            except ValueError:
+                if raise_on_error:
+                    raise
+        if self._on_options_change:
+            self._notify_options_change({k: self._options[k] for k in options.keys() if k in self._options})
+
+    def _set_option(self, key: str, value: any):
+        """Store an already validated option and notify subscribers, bypassing set_options dispatch."""
+        self._options[key] = value
+        self._options_json = None
+        if self._on_options_change:
+            self._notify_options_change({key: value})
 
     @property
     def visible(self) -> bool:
@@ -209,7 +278,7 @@ class Layer(abc.ABC):
 
     @visible.setter
     def visible(self, value: bool):
-        self.set_options({'visible': value})
+        self._set_option('visible', _check_visible(value))
 
     @property
     def opacity(self) -> float:
@@ -217,7 +286,7 @@ class Layer(abc.ABC):
 
     @opacity.setter
     def opacity(self, value: float):
-        self.set_options({'opacity': value})
+        self._set_option('opacity', _check_opacity(value))
 
     @property
     def label(self) -> str:
@@ -225,7 +294,7 @@ class Layer(abc.ABC):
 
     @label.setter
     def label(self, value: str):
-        self.set_options({'label': value})
+        self._set_option('label', _check_label(value))
 
     @property
     def z_index(self) -> float:
@@ -233,11 +302,11 @@ class Layer(abc.ABC):
 
     @z_index.setter
     def z_index(self, value: float):
-        self.set_options({'z_index': value})
+        self._set_option('z_index', _check_z_index(value))
 
     @property
     def domain(self) -> Rect:
-        return Rect(*self._options['domain'])
+        return self._options['domain']
 
     @domain.setter
     def domain(self, value: LayerDomain | None):
@@ -247,13 +316,13 @@ class Layer(abc.ABC):
                 if not Rect.is_empty(shape):
                     value = Rect.from_size(self.shape).fit(self._main_domain, 'fit_width')
                     self._domain_mode = 'manual'
-            case 'fit_height' | 'fit_width' | 'fit_inner' | 'fit_outer' | 'centered':
+            case str() if value in _FIT_MODES:
                 if not Rect.is_empty(shape):
                     value = Rect.from_size(self.shape).fit(self._main_domain, value)
                     self._domain_mode = value
             case _:
                 value = Rect(*value)
-        self.set_options({'domain': value})
+        self._set_option('domain', _check_domain(value))
 
     @property
     def domain_mode(self) -> FitMode | None:
@@ -279,8 +348,8 @@ class Layer(abc.ABC):
                         self.domain = transform_domain(self.domain)
                     case transform_domain if is_domain(transform_domain):
                         self.domain = transform_domain
-            case 'fit_height' | 'fit_width' | 'fit_inner' | 'fit_outer' | 'centered':
-                self.domain = self.domain_mode
+            case str() as mode if mode in _FIT_MODES:
+                self.domain = mode
 
     # --- Fetch data methods ---
     def get_data(self, **kwargs) -> LayerData:
@@ -326,22 +395,26 @@ class Layer(abc.ABC):
             callback(self)
 
     def on_data_change(self, callback: LayerDataChangeDispatcher):
-        uuid = uuid4().hex
-        while uuid in self._on_data_change:
-            uuid = uuid4().hex
-        self._on_data_change[uuid] = callback
-        return DispatcherUnbind(self._on_data_change, uuid)
+        self._callbacks_count += 1
+        self._on_data_change[self._callbacks_count] = callback
+        return DispatcherUnbind(self._on_data_change, self._callbacks_count)
 
     def _notify_options_change(self, options_changed: Dict[str, any]):
+        self._options_json = None
         for callback in self._on_options_change.values():
             callback(self, options_changed)
 
     def on_options_change(self, callback: LayerOptionsChangeDispatcher):
-        uuid = uuid4().hex
-        while uuid in self._on_options_change:
-            uuid = uuid4().hex
-        self._on_options_change[uuid] = callback
-        return DispatcherUnbind(self._on_options_change, uuid)
+        self._callbacks_count += 1
+        self._on_options_change[self._callbacks_count] = callback
+        return DispatcherUnbind(self._on_options_change, self._callbacks_count)
+
+    def on_change(self, data_callback: LayerDataChangeDispatcher, options_callback: LayerOptionsChangeDispatcher):
+        """Subscribe to both data and options changes, returning a single unbind callable."""
+        self._callbacks_count += 1
+        self._on_data_change[self._callbacks_count] = data_callback
+        self._on_options_change[self._callbacks_count] = options_callback
+        return DispatcherUnbind((self._on_data_change, self._on_options_change), self._callbacks_count)
 
     def _ipython_display_(self):
         from .view2d import View2D
@@ -350,22 +423,47 @@ class Layer(abc.ABC):
         return display(View2D(self))
 
 
+_z_index_key = attrgetter('z_index')
+
+
 # ======================================================================================================================
 #   Layer base class list
 # ======================================================================================================================
 class LayersList(metaclass=abc.ABCMeta):
+    __slots__ = ('_layers', '_layers_alias', '_alias_by_uuid', '_layers_by_alias', '_layers_binding',
+                 '_layers_by_type', '_visible_layers', '_update_lock', '_main_layer', '_main_layer_obj',
+                 '_max_z_index', '_alias_counter', '_layers_domain', '_last_main_domain')
+
     _layers: dict[str, Layer]
     _layers_alias: dict[str, str]
-    _layers_binding: dict[str, list[DispatcherUnbind]]
+    _alias_by_uuid: dict[str, str]
+    _layers_by_alias: MappingProxyType[str, Layer] | None
+    _layers_binding: dict[str, DispatcherUnbind]
+    _layers_by_type: dict[str, dict[str, Layer]]
+    _visible_layers: set[str]
     _main_layer: str | None
+    _main_layer_obj: Layer | None
+    _max_z_index: float | None
+    _alias_counter: dict[str, int]
+    _layers_domain: Rect | None
+    _last_main_domain: Rect | None
 
     def __init__(self):
         super(LayersList, self).__init__()
         self._layers = {}
         self._layers_alias = {}
+        self._alias_by_uuid = {}
+        self._layers_by_alias = None
         self._layers_binding = {}
+        self._layers_by_type = {}
+        self._visible_layers = set()
         self._update_lock = ContextLock(self.__release_update_lock)
         self._main_layer = None
+        self._main_layer_obj = None
+        self._max_z_index = 0
+        self._alias_counter = {}
+        self._layers_domain = None
+        self._last_main_domain = None
 
     # --- Public methods to add, manipulate and remove layers ---
     def add_layer(self, layer: Layer, alias: str | None = None, domain: LayerDomain | None = None):
@@ -383,10 +481,16 @@ class LayersList(metaclass=abc.ABCMeta):
         """
         main_layer = False
         if alias is None:
-            for i in range(1, len(self._layers) + 2):
-                alias = f"{layer.layer_type.title()} {i:02d}"
+            # Auto-generated aliases take the smallest free number of their layer type. Every number up to the
+            # counter is in use (removing a numbered alias lowers it), so the search starts right after it.
+            prefix = layer.layer_type.title()
+            i = self._alias_counter.get(prefix, 0)
+            while True:
+                i += 1
+                alias = f"{prefix} {i:02d}"
                 if alias not in self._layers_alias:
                     break
+            self._alias_counter[prefix] = i
         elif alias in self:
             main_layer = self[alias].uuid == self._main_layer
             self.remove_layer(alias)
@@ -398,7 +502,7 @@ class LayersList(metaclass=abc.ABCMeta):
             layer = layer.duplicate()
 
         if layer.z_index == -1:
-            layer.z_index = max([l.z_index for l in self]+[0]) + 1
+            layer.z_index = self._top_z_index() + 1
 
         if domain is None:
             domain = layer.domain if layer.domain_mode == 'manual' else layer.domain_mode
@@ -414,6 +518,11 @@ class LayersList(metaclass=abc.ABCMeta):
 
         self._layers[layer.uuid] = layer
         self._layers_alias[alias] = layer.uuid
+        self._alias_by_uuid[layer.uuid] = alias
+        self._layers_by_alias = None
+        if self._max_z_index is not None:
+            self._max_z_index = max(self._max_z_index, layer.z_index)
+        self._layers_domain = None
         self._bind_layer(layer)
         self._send_new_layers([layer])
 
@@ -421,14 +530,34 @@ class LayersList(metaclass=abc.ABCMeta):
             self.main_layer = layer
 
     def remove_layer(self, layer: str | Layer | int):
-        layer = self._item_to_layer(layer)
-        if layer.uuid == self._main_layer:
-            self.main_layer = next((l for l in self if l.uuid != self._main_layer), None)
+        self.remove_layers([layer])
 
-        self._send_delete_layers([layer])
-        self._unbind_layer(layer)
-        del self._layers_alias[self.get_layers_alias(layer)]
-        del self._layers[layer.uuid]
+    def remove_layers(self, layers: Iterable[str | Layer | int]):
+        """
+        Remove several layers at once, notifying their deletion in a single update.
+
+        :param layers: The layers to remove, given as aliases, layers or indexes.
+        """
+        layers = list(dict.fromkeys(self._item_to_layer(layer) for layer in layers))
+        if not layers:
+            return
+        removed = {layer.uuid for layer in layers}
+        if self._main_layer in removed:
+            self.main_layer = next((l for l in self if l.uuid not in removed), None)
+
+        self._send_delete_layers(layers)
+        for layer in layers:
+            self._unbind_layer(layer)
+            alias = self._alias_by_uuid.pop(layer.uuid)
+            del self._layers_alias[alias]
+            prefix, _, i = alias.rpartition(' ')
+            if i.isdigit() and 0 < int(i) <= self._alias_counter.get(prefix, 0):
+                self._alias_counter[prefix] = int(i) - 1
+            del self._layers[layer.uuid]
+            if layer.z_index == self._max_z_index:
+                self._max_z_index = None
+        self._layers_by_alias = None
+        self._layers_domain = None
 
     def update_all_options(self, options, layer_selector: str | Iterable[str | Layer] | LayerSelector | None):
         layers = self.get_layers(layer_selector)
@@ -437,12 +566,13 @@ class LayersList(metaclass=abc.ABCMeta):
                 layer.set_options(options)
 
     def update_options(self, layers_options: Mapping[str | Layer, Mapping[str, any]]):
-        layers_options = {self[k] if isinstance(k, str) else k: v for k, v in layers_options.items()}
+        layers_options = {self._item_to_layer(k) if isinstance(k, str) else k: v for k, v in layers_options.items()}
+        main_layer_options = layers_options.get(self._main_layer_obj)
         with self._update_lock:
-            if self.main_layer in layers_options and 'domain' in layers_options[self.main_layer]:
-                self._update_main_layer_domain()
             for layer, opt in layers_options.items():
                 layer.set_options(opt)
+            if main_layer_options is not None and 'domain' in main_layer_options:
+                self._update_main_layer_domain()
         # self._send_update_layers_options(layers_options)
 
     def update_all_data(self, data: any, layer_selector: str | Iterable[str] | LayerSelector | None):
@@ -452,15 +582,19 @@ class LayersList(metaclass=abc.ABCMeta):
                 layer.update_data(data)
 
     def update_data(self, data: Mapping[str | Layer, any]):
-        data = {self[k] if isinstance(k, str) else k: v for k, v in data.items()}
+        data = {self._item_to_layer(k) if isinstance(k, str) else k: v for k, v in data.items()}
         with self._update_lock:
             for layer, d in data.items():
                 layer.update_data(d)
 
     # --- Accessors for layers and aliases ---
     @property
-    def layers(self) -> dict[str, Layer]:
-        return {alias: self._layers[uuid] for alias, uuid in self._layers_alias.items()}
+    def layers(self) -> Mapping[str, Layer]:
+        if self._layers_by_alias is None:
+            # Rebuilt only after a layer is added or removed.
+            self._layers_by_alias = MappingProxyType({alias: self._layers[uuid]
+                                                      for alias, uuid in self._layers_alias.items()})
+        return self._layers_by_alias
 
     @property
     def layers_alias(self) -> tuple[str]:
@@ -468,28 +602,35 @@ class LayersList(metaclass=abc.ABCMeta):
 
     @property
     def main_layer(self) -> Layer | None:
-        return self._layers[self._main_layer] if self._main_layer is not None else None
+        return self._main_layer_obj
 
     @main_layer.setter
     def main_layer(self, main_layer: str | Layer | None):
         if main_layer is None:
             self._main_layer = None
+            self._main_layer_obj = None
         else:
             main_layer = self._item_to_layer(main_layer)
             new_domain = main_layer.domain
 
-            if self._main_layer is not None:
-                previous_domain = self.main_layer.domain
-                transform = Transform.from_rects(previous_domain, new_domain)
-            else:
-                transform = None
-
+            transform = None
+            if main_layer is not self._main_layer_obj:
+                # The former main layer was never fitted to the main domain: always propagate to it,
+                # with an explicit (possibly identity) transform.
+                self._last_main_domain = None
+                if self._main_layer_obj is not None:
+                    transform = Transform.from_rects(self._main_layer_obj.domain, new_domain)
             self._main_layer = main_layer.uuid
+            self._main_layer_obj = main_layer
             self._update_main_layer_domain(transform)
 
     def _update_main_layer_domain(self, transform: Transform | None = None):
+        new_domain = self._main_layer_obj.domain
+        if transform is None and new_domain == self._last_main_domain:
+            # The other layers are already fitted to this domain.
+            return
+        self._last_main_domain = new_domain
         with self._update_lock:
-            new_domain = self.main_layer.domain
             for layer in self:
                 if layer.uuid != self._main_layer:
                     layer.set_main_shape(new_domain, transform)
@@ -498,35 +639,56 @@ class LayersList(metaclass=abc.ABCMeta):
                    only_visible=False, sort_zindex=False,
                    layer_type: Type[Layer] | str | Iterable[Type[Layer] | str] | None = None
                    ) -> list[Layer]:
-        match layers_selector:
-            case None:
-                layers = self._layers.values()
-            case str():
-                try:
-                    layers = [self[layers_selector]]
-                except KeyError:
-                    raise ValueError(f'Unknown layer {layers_selector}')
-            case Layer():
-                if layers_selector not in self:
-                    raise ValueError(f'The provided layer is not in the list.')
-                layers = [layers_selector]
-            case LayerSelector():
-                layers = [layer for name, layer in self.items() if layers_selector(name, layer)]
-            case _:  # Iterable[str | Layer]
-                layers = [self[layer] for layer in layers_selector]
+        if layers_selector is None and layer_type is None and not only_visible:
+            # Fast path: all the layers, unfiltered.
+            if sort_zindex:
+                return sorted(self._layers.values(), key=_z_index_key)
+            return list(self._layers.values())
+
+        if layer_type is not None and not isinstance(layer_type, tuple):
+            layer_type = (layer_type,)
+
+        if layers_selector is None and layer_type is not None and all(isinstance(_, str) for _ in layer_type):
+            # Filtering on layer_type names only: read the layers from the type index.
+            if len(layer_type) == 1:
+                layers = list(self._layers_by_type.get(layer_type[0], {}).values())
+            else:
+                uuids = set().union(*(self._layers_by_type.get(_, ()) for _ in layer_type))
+                layers = [layer for uuid, layer in self._layers.items() if uuid in uuids]
+            layer_type = None
+        else:
+            layers = self._select_layers(layers_selector)
 
         if only_visible:
-            layers = [layer for layer in layers if layer.visible]
+            visible_layers = self._visible_layers
+            layers = [layer for layer in layers if layer.uuid in visible_layers]
         if layer_type is not None:
-            if not isinstance(layer_type, tuple):
-                layer_type = (layer_type,)
             layers = [layer for layer in layers if
                       any(layer.layer_type == l_type if isinstance(l_type, str) else isinstance(layer, l_type)
                           for l_type in layer_type)]
         if sort_zindex:
-            layers.sort(key=lambda l: l.z_index)
+            layers.sort(key=_z_index_key)
         return layers
 
+    def _select_layers(self, layers_selector: str | Layer | Iterable[str | Layer] | LayerSelector | None
+                       ) -> Iterable[Layer]:
+        if layers_selector is None:
+            return self._layers.values()
+        elif isinstance(layers_selector, str):
+            try:
+                return [self._layers[self._layers_alias[layers_selector]]]
+            except KeyError:
+                raise ValueError(f'Unknown layer {layers_selector}') from None
+        elif isinstance(layers_selector, Layer):
+            if layers_selector.uuid not in self._layers:
+                raise ValueError(f'The provided layer is not in the list.')
+            return [layers_selector]
+        elif callable(layers_selector):  # LayerSelector is not runtime checkable
+            return [layer for name, layer in self.items() if layers_selector(name, layer)]
+        else:  # Iterable[str | Layer]
+            item_to_layer = self._item_to_layer
+            return [item_to_layer(layer) for layer in layers_selector]
+
     def get_layers_alias(self, layers: Layer | Iterable[Layer] | None = None,
                          sort_zindex=False, only_visible=False,
                          by_type: Type[Layer] | str | Iterable[Type[Layer] | str] | None = None
@@ -534,35 +696,32 @@ class LayersList(metaclass=abc.ABCMeta):
         single_layer = isinstance(layers, Layer)
         layers = self.get_layers(layers, sort_zindex=sort_zindex, only_visible=only_visible, layer_type=by_type)
 
-        layers_alias = []
-        for layer in layers:
-            for alias, uuid in self._layers_alias.items():
-                if uuid == layer.uuid:
-                    layers_alias.append(alias)
-                    break
-            else:
-                layers_alias.append(None)
+        layers_alias = [self._alias_by_uuid.get(layer.uuid) for layer in layers]
         return layers_alias[0] if single_layer else layers_alias
 
     def layers_domain(self) -> Rect:
-        domain = Rect.empty()
-        for layer in self:
-            domain = domain | Rect.from_size(layer.shape) if layer.domain == 'auto' else layer.domain
-        return domain
+        """Bounding rect of the domains of all the layers (cached until a layer or its domain changes)."""
+        if self._layers_domain is None:
+            domain = None
+            for layer in self._layers.values():
+                layer_domain = layer.domain
+                if layer_domain.is_self_empty():
+                    continue
+                domain = layer_domain if domain is None else domain | layer_domain
+            self._layers_domain = Rect.empty() if domain is None else domain
+        return self._layers_domain
 
     # --- Item and Iterables accessors ---
     def __len__(self):
         return len(self._layers)
 
     def __iter__(self):
-        return self._layers.values().__iter__()
+        return iter(self._layers.values())
 
     def __contains__(self, item: str | Layer):
-        match item:
-            case str():
-                return item in self._layers_alias
-            case Layer():
-                return item.uuid in self._layers
+        if isinstance(item, str):
+            return item in self._layers_alias
+        return isinstance(item, Layer) and item.uuid in self._layers
 
     def __getitem__(self, key: int | str) -> Layer:
         return self._item_to_layer(key)
@@ -586,48 +745,74 @@ class LayersList(metaclass=abc.ABCMeta):
         return zip(self._layers_alias.keys(), self._layers.values())
 
     # --- Private methods for layer handling ---
+    def _top_z_index(self) -> float:
+        # Maintained incrementally, only rescanned after the top layer was removed or a layer was lowered.
+        if self._max_z_index is None:
+            self._max_z_index = max([l.z_index for l in self] + [0])
+        return self._max_z_index
+
     def _item_to_layer(self, item: int | str | Layer) -> Layer:
-        if isinstance(item, (int, slice)):
-            layers = list(self._layers.values())
-            return layers[item]
-        elif isinstance(item, str):
-            if item not in self._layers_alias:
-                raise KeyError(f'No layer named {item}.')
-            return self._layers[self._layers_alias[item]]
+        if isinstance(item, str):
+            try:
+                return self._layers[self._layers_alias[item]]
+            except KeyError:
+                raise KeyError(f'No layer named {item}.') from None
         elif isinstance(item, Layer):
-            if item not in self:
+            if item.uuid not in self._layers:
                 raise KeyError(f'This layer is not part of the list.')
             return item
+        elif isinstance(item, (int, slice)):
+            layers = list(self._layers.values())
+            return layers[item]
 
     # --- Private methods for communication ---
     def _bind_layer(self, layer: Layer):
-        # Bind options events
-        self._layers_binding[layer.uuid] = [
-            layer.on_data_change(self.__update_layer_data),
-            layer.on_options_change(self.__update_layer_options)
-        ]
+        # Bind data and options events
+        self._layers_binding[layer.uuid] = layer.on_change(self.__update_layer_data, self.__update_layer_options)
+        # Index the layer by type and visibility
+        self._layers_by_type.setdefault(layer.layer_type, {})[layer.uuid] = layer
+        if layer.visible:
+            self._visible_layers.add(layer.uuid)
 
     def _unbind_layer(self, layer: Layer):
-        for unbind in self._layers_binding.get(layer.uuid, ()):
+        unbind = self._layers_binding.pop(layer.uuid, None)
+        if unbind is not None:
             unbind()
+        self._layers_by_type.get(layer.layer_type, {}).pop(layer.uuid, None)
+        self._visible_layers.discard(layer.uuid)
 
     def __update_layer_data(self, layer: Layer):
-        if not self._update_lock:
+        if not self._update_lock.locked:
             self._send_update_layers_data([layer])
         else:
             self._update_lock.add('data', layer)
 
     def __update_layer_options(self, layer: Layer, options: Mapping[str, any]):
-        if not self._update_lock:
+        if 'domain' in options:
+            self._layers_domain = None
+        if 'z_index' in options and self._max_z_index is not None:
+            if layer.z_index >= self._max_z_index:
+                self._max_z_index = layer.z_index
+            else:
+                # The layer may have held the maximum before being lowered: recompute it on the next access.
+                self._max_z_index = None
+        if 'visible' in options:
+            if layer.visible:
+                self._visible_layers.add(layer.uuid)
+            else:
+                self._visible_layers.discard(layer.uuid)
+        if not self._update_lock.locked:
             self._send_update_layers_options({layer: options})
         else:
             self._update_lock.add('options', layer)
 
-    def __release_update_lock(self, updated: dict[str, set]):
-        if 'data' in updated:
-            self._send_update_layers_data(updated['data'])
-        elif 'options' in self._update_lock:
-            self._send_update_layers_options({layer: layer.options for layer in updated['options']})
+    def __release_update_lock(self, updated: dict[str, list]):
+        data_updated = updated.get('data')
+        if data_updated:
+            self._send_update_layers_data(data_updated)
+        options_updated = updated.get('options')
+        if options_updated:
+            self._send_update_layers_options({layer: layer.options for layer in options_updated})
 
     # --- Abstract methods for communication ---
     @abc.abstractmethod
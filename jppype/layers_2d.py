@@ -1,7 +1,7 @@
 import base64
+import functools
 import os.path
 
-import cv2
 import numpy as np
 import re
 from typing import Tuple, Literal, Dict, List
@@ -9,19 +9,74 @@ from typing import Tuple, Literal, Dict, List
 from .layer_base import Layer, LayerData, LayerDomain
 from .utils import Rect, Transform
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+
+@functools.cache
+def _color_name_to_hex(name: str) -> str:
+    import webcolors
+    return webcolors.name_to_hex(name)
+
+
+_CATPPUCCIN_COLORS = ('#8caaee', '#99d1db', '#a6d189', '#ef9f76', '#e78284', '#f4b8e4', '#f2d5cf',
+                      '#babbf1', '#85c1dc', '#81c8be', '#e5c890', '#ea999c', '#ca9ee6', '#eebebe')
+
+_HEX_COLOR_RE = re.compile(r'^#(?:[0-9a-fA-F]{3,4}){1,2}$')
+_URL_RE = re.compile(r'^https?://')
+
+# Dtypes accepted by cv2.resize and by cv2 arithmetic functions
+_CV_RESIZE_DTYPES = frozenset(np.dtype(_) for _ in (np.uint8, np.uint16, np.int16, np.float32, np.float64))
+_CV_ARITHM_DTYPES = _CV_RESIZE_DTYPES | frozenset(np.dtype(_) for _ in (np.int8, np.int32))
+# Largest width or height of a WebP image, larger images are encoded as JPEG.
+_WEBP_MAX_SIZE = 16383
+
+
+def _is_tensor(data) -> bool:
+    # Duck-typed torch.Tensor check, so torch is never imported by jppype.
+    return not isinstance(data, np.ndarray) and type(data).__qualname__ == 'Tensor'
+
+
+def _fits_uint32(labels: np.ndarray) -> bool:
+    """Check if an array holds non-negative integers encodable on 32 bits, reading it at most once."""
+    dtype = labels.dtype
+    if dtype.kind == 'b' or (dtype.kind == 'u' and dtype.itemsize <= 4):
+        return True
+    elif dtype.kind not in 'iu':
+        return False
+    elif labels.size == 0:
+        return True
+    # Viewed as unsigned, negative integers become larger than any valid label: a single max() checks both bounds.
+    unsigned = labels.view(dtype.str.replace('i', 'u'))
+    limit = 2**32 if dtype.itemsize > 4 else 2**(dtype.itemsize * 8 - 1)
+    return int(unsigned.max()) < limit
+
 
 class LayerImage(Layer):
+    # Lossy format of the encoded images: WebP payloads are much smaller than JPEG ones at the same quality.
+    encode_format: Literal['webp', 'jpg'] = 'webp'
+
     def __init__(self, image,
                  vmax: Literal['auto'] | float | None = 'auto', vmin: Literal['auto'] | float | None = 'auto',
                  resize_buffer: Tuple[int, int] | int | None = None):
         super().__init__('image')
         self.buffer_size = resize_buffer
         self._image = None
+        self._channels_bgr = False
         self.image = image
 
         self.vmin = vmin
         self.vmax = vmax
 
+    def __copy__(self):
+        layer = super().__copy__()
+        # The duplicate fills its own cache: sharing the dict would race with the original's on eviction.
+        layer._image_range = None
+        layer._fetch_cache = {}
+        return layer
+
     # --- Properties ---
     @property
     def image(self):
@@ -29,25 +84,57 @@ class LayerImage(Layer):
 
     @image.setter
     def image(self, img):
+        previous_shape = self.shape
         if isinstance(img, int | float | bool):
-            img = np.empty(self.shape[:2], dtype=np.float).fill(img)
+            img = np.full(previous_shape, img, dtype=np.float32)
         else:
+            # Images decoded by OpenCV from a path or an url are kept in its BGR(A) channel order.
+            self._channels_bgr = isinstance(img, str)
             img = LayerImage.cast_img_format(img, self.buffer_size)
         self._image = img
+        self._image_range = None
+        self._fetch_cache = {}
         self._notify_data_change()
-        self._notify_options_change({'domain': self.shape})
+        if self.shape != previous_shape:
+            self._notify_options_change({'domain': self.shape})
+
+    def image_range(self) -> Tuple[float, float]:
+        """Minimum and maximum values of the image, computed once per image."""
+        if self._image_range is None:
+            img = self._image
+            if img.dtype in _CV_ARITHM_DTYPES and img.flags.c_contiguous and img.size:
+                import cv2
+                # Single pass for both bounds (channels are flattened into the rows of a 2D view).
+                vmin, vmax, _, _ = cv2.minMaxLoc(img.reshape(img.shape[0], -1))
+                self._image_range = (vmin, vmax)
+            else:
+                # Python floats: numpy unsigned scalars would wrap on negation or subtraction.
+                self._image_range = (float(np.min(img)), float(np.max(img)))
+        return self._image_range
 
     # --- Implementation of layer's abstract methods ---
     def _fetch_data(self, resize: tuple[int, int] | None = None) -> LayerData:
+        # The encoded image only depends on the image (the cache is reset by its setter), resize, vmin, vmax and
+        # the encoding format.
+        cache_key = (tuple(resize) if isinstance(resize, list) else resize, self.vmin, self.vmax, self.encode_format)
+        data = self._fetch_cache.get(cache_key)
+        if data is None:
+            data = self._encode_data(resize)
+            if len(self._fetch_cache) >= 8:
+                del self._fetch_cache[next(iter(self._fetch_cache))]
+            self._fetch_cache[cache_key] = data
+        return data
+
+    def _encode_data(self, resize: tuple[int, int] | None = None) -> LayerData:
         img = self._image
 
         if self.vmax == 'auto':
-            vmax = np.max(img)
+            vmax = self.image_range()[1]
         else:
             vmax = self.vmax
 
         if self.vmin == 'auto':
-            vmin = np.min(img)
+            vmin = self.image_range()[0]
             if vmin < 0 < vmax and .75 < abs(vmax + vmin)/vmax < 1.25:
                 vmin = -vmax
             elif abs(vmin) < abs(vmax) * .1 and vmax > 0:
@@ -58,18 +145,44 @@ class LayerImage(Layer):
         if self.vmax == 'auto' and abs(vmax) < abs(vmin) * .1 and vmin < 0:
             vmax = 0
 
-        if vmin is not None:
-            img = img - np.min(img)
-            if vmax is not None:
-                vmax = vmax - vmin
-        if vmax is not None:
-            img = img / vmax * 255.
-
+        # When shrinking, resize first so the normalization only runs on the displayed pixels.
+        # INTER_AREA averaging only commutes with the normalization while no value is clipped to 0 or 255, so this
+        # is restricted to images whose whole range lies within the mapped interval.
         h, w = img.shape[:2]
-        if resize is not None:
+        resized = False
+        if resize is not None and img.dtype in _CV_RESIZE_DTYPES:
+            resized_w, resized_h = LayerImage.fit_size(img.shape, resize)
+            low = vmin if vmin is not None else 0
+            high = vmax if vmax is not None else low + 255
+            img_min, img_max = self.image_range()
+            if resized_w * resized_h < w * h and low <= img_min and img_max <= high:
+                img = self.fit_resize(img, resize)
+                resized = True
+
+        img = LayerImage.normalize_uint8(img, vmin, vmax)
+
+        if resize is not None and not resized:
             img = self.fit_resize(img, resize)
 
-        return LayerData(self.encode_url(img, 'jpg'), infos=dict(width=w, height=h))
+        encode_format = self.encode_format
+        if encode_format == 'webp' and max(img.shape[:2]) > _WEBP_MAX_SIZE:
+            encode_format = 'jpg'
+
+        if img.ndim == 3 and img.shape[2] in (3, 4):
+            # cv2.imencode expects BGR(A) channels: reorder the uint8 buffer once, explicitly.
+            # WebP keeps the alpha channel, JPEG can't store it so it is dropped in the same pass.
+            import cv2
+            keep_alpha = encode_format == 'webp'
+            if img.shape[2] == 3:
+                code = None if self._channels_bgr else cv2.COLOR_RGB2BGR
+            elif self._channels_bgr:
+                code = None if keep_alpha else cv2.COLOR_BGRA2BGR
+            else:
+                code = cv2.COLOR_RGBA2BGRA if keep_alpha else cv2.COLOR_RGBA2BGR
+            if code is not None:
+                img = cv2.cvtColor(img, code)
+
+        return LayerData(self.encode_url(img, encode_format), infos=dict(width=w, height=h))
 
     def _shape(self):
         return self._image.shape[:2] if self._image is not None else (0, 0)
@@ -100,10 +213,13 @@ class LayerImage(Layer):
         Casted image
 
         """
-        if isinstance(img, str):
+        if isinstance(img, np.ndarray):
+            pass
+        elif isinstance(img, str):
+            import cv2
             if os.path.exists(img):
                 img = cv2.imread(img)
-            elif re.match(r'^https?://', img):
+            elif _URL_RE.match(img):
                 from urllib.request import urlopen
                 resp = urlopen(img)
                 img = np.asarray(bytearray(resp.read()), dtype=np.uint8)
@@ -112,12 +228,14 @@ class LayerImage(Layer):
                     raise ValueError(f'Invalid image url {img}.')
             else:
                 raise ValueError(f'Invalid image path {img}.')
-        elif type(img).__qualname__ == 'Tensor':
+        elif _is_tensor(img):
             img = img.detach().cpu().numpy()
 
         if len(img.shape) == 3:
             if img.shape[0] in (1, 3) and img.shape[2] not in (1, 3):
-                img = img.transpose((1, 2, 0))
+                # Copy channel-first images once to a contiguous (H, W, C) buffer, rather than letting every
+                # cv2 call make its own copy of the strided view.
+                img = np.ascontiguousarray(img.transpose((1, 2, 0)))
             if img.shape[2] == 1:
                 img = img[:, :, 0]
         elif len(img.shape) != 2:
@@ -129,20 +247,61 @@ class LayerImage(Layer):
         return img
 
     @staticmethod
-    def fit_resize(img: np.ndarray, size: Tuple[int, int] | int, interpolation=None) -> np.ndarray:
+    def normalize_uint8(img: np.ndarray, vmin: float | None, vmax: float | None) -> np.ndarray:
+        """
+        Linearly map [vmin, vmax] to [0, 255] and saturate the result to uint8.
+        If vmin is None the values are not shifted, if vmax is None they are not scaled.
+        """
+        # Numpy unsigned scalars would wrap in -vmin or vmax - vmin.
+        vmin = float(vmin) if vmin is not None else None
+        vmax = float(vmax) if vmax is not None else None
+        scale = 1.
+        if vmax is not None:
+            span = vmax - vmin if vmin is not None else vmax
+            scale = 255. / span if span else 0.
+        offset = -vmin * scale if vmin is not None else 0.
+
+        if img.dtype == np.uint8 and scale == 1 and offset == 0:
+            return img
+        elif img.dtype == np.bool_:
+            img = img.view(np.uint8)
+        elif img.dtype == np.float16:
+            img = img.astype(np.float32)
+        elif img.dtype not in _CV_ARITHM_DTYPES:
+            # 64 bits and uint32 integers: float32 could not represent them exactly.
+            img = img.astype(np.float64)
+
+        import cv2
+        if img.dtype == np.uint8:
+            # Only 256 possible values: map them once and apply the table with a byte lookup per pixel.
+            values = np.arange(256, dtype=np.uint8)
+            return cv2.LUT(img, cv2.addWeighted(values, scale, values, 0, offset, dtype=cv2.CV_8U))
+        # Single pass computing saturate_cast<uint8>(img * scale + offset).
+        return cv2.addWeighted(img, scale, img, 0, offset, dtype=cv2.CV_8U)
+
+    @staticmethod
+    def fit_size(shape: Tuple[int, ...], size: Tuple[int, int] | int) -> Tuple[int, int]:
+        """(width, height) of an image of the given shape resized to fit in ``size``, keeping its aspect ratio."""
         if isinstance(size, int):
             size = (size, size)
+        h, w = shape[:2]
+        ratio = h / w
+        mindim = min(size[0] * ratio, size[1])
+        return round(mindim / ratio), round(mindim)
 
+    @staticmethod
+    def fit_resize(img: np.ndarray, size: Tuple[int, int] | int, interpolation=None) -> np.ndarray:
+        import cv2
         # Keep aspect ratio
         h, w = img.shape[:2]
-        ratio = h / w
-        mindim = min(size[0] * ratio, size[1])
-        size = (round(mindim / ratio), round(mindim))
+        size = LayerImage.fit_size(img.shape, size)
+        if size == (w, h):
+            return img
 
-        # Select interpolation method based on image resize
+        # Select interpolation method based on image resize: area averaging to shrink, bilinear to enlarge.
         if interpolation is None:
             if size[0] > w or size[1] > h:
-                interpolation = cv2.INTER_CUBIC
+                interpolation = cv2.INTER_LINEAR
             else:
                 interpolation = cv2.INTER_AREA
 
@@ -150,9 +309,30 @@ class LayerImage(Layer):
         return cv2.resize(img, size, interpolation=interpolation)
 
     @staticmethod
-    def encode_url(img: np.ndarray, format='jpg') -> str:
-        _, data = cv2.imencode('.'+format, img)
-        return f'data:image/{format};base64,' + base64.b64encode(data).decode('ascii')
+    def encode_url(img: np.ndarray, format='jpg', quality: int = 80) -> str:
+        """
+        Encode an image as a base64 data URL.
+
+        JPEG and WebP are encoded with the given ``quality``. PNG, used for label maps, is encoded with the fastest
+        zlib level and the run-length strategy, which suits their long runs of identical pixels.
+        """
+        import cv2
+        match format:
+            case 'jpg' | 'jpeg':
+                params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+            case 'webp':
+                params = [cv2.IMWRITE_WEBP_QUALITY, quality]
+            case 'png':
+                params = [cv2.IMWRITE_PNG_COMPRESSION, 1, cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE]
+            case _:
+                params = []
+        # imencode returns a contiguous (N, 1) uint8 array: encode it through the buffer protocol, without tobytes().
+        _, data = cv2.imencode('.'+format, img, params)
+        if pybase64 is not None:
+            b64 = pybase64.b64encode_as_string(data)
+        else:
+            b64 = base64.b64encode(data).decode('ascii')
+        return f'data:image/{format};base64,{b64}'
 
 
 class LayerLabel(Layer):
@@ -161,24 +341,28 @@ class LayerLabel(Layer):
         self.label_map = label_map
         self.colormap = colormap
 
+    def __copy__(self):
+        layer = super().__copy__()
+        # The duplicate fills its own cache: sharing the dict would race with the original's on eviction.
+        layer._fetch_cache = {}
+        return layer
+
     @property
     def label_map(self):
         return self._label_map
 
     @label_map.setter
     def label_map(self, data):
-        if type(data).__qualname__ == 'Tensor':
+        if _is_tensor(data):
             data = data.detach().cpu().numpy()
         assert isinstance(data, np.ndarray), f'Invalid label type {type(data)}. Must be numpy.ndarray.'
         assert data.ndim == 2, f'Invalid label shape {data.shape}. Must be (H, W).'
 
-        error = ValueError(f'Invalid label type {data.dtype}. Must be positive integer encoded on maximum 32 bits.')
-        if data.dtype.kind not in '?bBiu':
-            raise error
-        elif np.min(data) < 0 or np.max(data) >= 2**32:
-            raise error
+        if not _fits_uint32(data):
+            raise ValueError(f'Invalid label type {data.dtype}. Must be positive integer encoded on maximum 32 bits.')
 
-        self._label_map = data.astype(np.uint32)
+        self._label_map = LayerLabel.compact_labels(data)
+        self._fetch_cache = {}
         self._notify_data_change()
 
     @property
@@ -197,17 +381,15 @@ class LayerLabel(Layer):
         assert isinstance(name, str), f'Invalid colormap name {name}. Must be str.'
         match name:
             case 'catppuccin':
-                return ['#8caaee', '#99d1db', '#a6d189', '#ef9f76', '#e78284', '#f4b8e4', '#f2d5cf',
-                        '#babbf1', '#85c1dc', '#81c8be', '#e5c890', '#ea999c', '#ca9ee6', '#eebebe']
+                return list(_CATPPUCCIN_COLORS)
             case _:
                 return [LayerLabel.check_color(name)]
 
     @staticmethod
     def check_label_colormap(cmap, null_label=True) -> Dict[int, str]:
         if not null_label and isinstance(cmap, dict):
-            if None in cmap:
-                cmap[-1] = cmap.pop(None)
-            cmap = {k+1: v for k, v in cmap.items()}
+            # Shift labels by one, the None entry becoming label 0 (without modifying the caller's dict).
+            cmap = {(-1 if k is None else k) + 1: v for k, v in cmap.items()}
         match cmap:
             case list() | tuple():
                 cmap = {0: list(cmap)}
@@ -224,24 +406,35 @@ class LayerLabel(Layer):
 
     @staticmethod
     def check_color(color: str):
-        if re.match(r'^#(?:[0-9a-fA-F]{3,4}){1,2}$', color) is not None:
+        if _HEX_COLOR_RE.match(color) is not None:
             return color
         else:
-            import webcolors
             try:
-                return webcolors.name_to_hex(color)
+                return _color_name_to_hex(color)
             except ValueError:
                 raise ValueError(f'Invalid color name {color}.')
 
     def _fetch_data(self, resize: Tuple[int, int] | None = None) -> LayerData:
+        # The encoded label map only depends on the label map (the cache is reset by its setter) and resize.
+        cache_key = tuple(resize) if isinstance(resize, list) else resize
+        data = self._fetch_cache.get(cache_key)
+        if data is None:
+            data = self._encode_data(resize)
+            if len(self._fetch_cache) >= 8:
+                del self._fetch_cache[next(iter(self._fetch_cache))]
+            self._fetch_cache[cache_key] = data
+        return data
+
+    def _encode_data(self, resize: Tuple[int, int] | None = None) -> LayerData:
         label = self._label_map
 
         h, w = label.shape[:2]
         if resize is not None:
+            import cv2
             label = LayerImage.fit_resize(label, resize, interpolation=cv2.INTER_NEAREST)
-        labels = np.unique(label).tolist()
+        labels = LayerLabel.unique_labels(label)
 
-        return LayerData(LayerLabel.encode_label_url(label),
+        return LayerData(LayerLabel.encode_label_url(label, max_label=labels[-1] if labels else 0),
                          infos={'width': w, 'height': h, 'labels': labels}, )
 
     def _shape(self):
@@ -257,14 +450,67 @@ class LayerLabel(Layer):
         self.label_map = data
 
     @staticmethod
-    def encode_label_url(label: np.ndarray) -> str:
-        alpha = (label >> 24).astype(np.uint8)
-        red = ((label >> 16) & 0xFF).astype(np.uint8)
-        green = ((label >> 8) & 0xFF).astype(np.uint8)
-        blue = (label & 0xFF).astype(np.uint8)
+    def compact_labels(label: np.ndarray) -> np.ndarray:
+        """Cast a non-negative integer label map to the smallest of uint8, uint16 or uint32 that holds its labels."""
+        if label.dtype == np.bool_:
+            return label.view(np.uint8)
+        elif label.dtype in (np.uint8, np.uint16):
+            return label
+        max_label = int(label.max()) if label.size else 0
+        dtype = np.uint8 if max_label < 2**8 else np.uint16 if max_label < 2**16 else np.uint32
+        return label.astype(dtype, copy=False)
+
+    @staticmethod
+    def unique_labels(label: np.ndarray, max_presence_label: int = 2**20) -> List[int]:
+        """
+        Sorted list of the distinct labels of a non-negative integer label map.
+
+        When the maximum label is lower than ``max_presence_label``, labels are found by marking a presence table
+        in a single linear pass instead of sorting the whole map as ``np.unique`` does.
+        """
+        if label.size == 0:
+            return []
+        max_label = int(label.max())
+        if max_label >= max_presence_label:
+            return np.unique(label).tolist()
+        present = np.zeros(max_label + 1, dtype=bool)
+        present[label.ravel()] = True
+        return np.flatnonzero(present).tolist()
+
+    @staticmethod
+    def encode_label_url(label: np.ndarray, max_label: int | None = None, max_lut_label: int = 2**16) -> str:
+        """
+        Encode a uint32 label map as a PNG data URL, each label being packed in the 4 channels of its pixel.
 
-        label = np.stack((red, green, blue, 255 - alpha), axis=-1)
-        return LayerImage.encode_url(label, 'png')
+        If the maximum label is known and lower than ``max_lut_label``, the pixels are read from a lookup table
+        of the encoded labels instead of converting every pixel.
+        """
+        if max_label is not None and max_label < max_lut_label:
+            # The table is converted as a one-row (1, max_label + 1) label map.
+            lut = LayerLabel._label_to_rgba(np.arange(max_label + 1, dtype='<u4')[None])[0]
+            return LayerImage.encode_url(lut.take(label, axis=0), 'png')
+        return LayerImage.encode_url(LayerLabel._label_to_rgba(label), 'png')
+
+    @staticmethod
+    def _label_to_rgba(label: np.ndarray, band_size: int = 2**15) -> np.ndarray:
+        import cv2
+        label = np.asarray(label, dtype='<u4')
+        shape = label.shape
+        label = label.reshape(-1, shape[-1]) if label.ndim > 1 else label.reshape(1, -1)
+        h, w = label.shape
+        rgba = np.empty((h, w, 4), dtype=np.uint8)
+
+        # Convert bands of about band_size pixels through a reused scratch buffer, so the working set stays in cache.
+        rows = max(1, band_size // max(w, 1))
+        band = np.empty((rows, w), dtype='<u4')
+        for y in range(0, h, rows):
+            n = min(rows, h - y)
+            # Invert the alpha byte (255 - a == a ^ 0xFF) with a vectorized xor on the uint32 labels.
+            np.bitwise_xor(label[y:y+n], np.uint32(0xFF000000), out=band[:n])
+            # View each little-endian uint32 label as its 4 bytes (low to high): blue, green, red, alpha,
+            # and swap them into (red, green, blue, alpha) directly in the output.
+            cv2.cvtColor(band[:n].view(np.uint8).reshape(n, w, 4), cv2.COLOR_BGRA2RGBA, dst=rgba[y:y+n])
+        return rgba.reshape(shape + (4,))
 
 
 class LayerGraph(Layer):
@@ -312,18 +558,20 @@ class LayerGraph(Layer):
         self._notify_data_change()
 
     def _set_adjacency_list(self, adj, check_dim=True):
-        if type(adj).__qualname__ == 'Tensor':
-            data = adj.detach().cpu().numpy()
-        adj = np.asarray(adj)
+        if _is_tensor(adj):
+            adj = adj.detach().cpu().numpy()
+        adj = np.ascontiguousarray(adj, dtype=np.uint32)
         assert adj.ndim == 2 and adj.shape[1] == 2, f'Invalid adjacency list shape {adj.shape}. Must be (E, 2).'
+        max_node = int(adj.max()) if adj.size else -1
         if check_dim:
             if self.nodes_coordinates is not None:
-                assert adj.max() < self.nodes_coordinates.shape[0], \
+                assert max_node < self.nodes_coordinates.shape[0], \
                     f'Invalid adjacency list. {self.nodes_coordinates.shape[0]} nodes are expected.'
             if self.edge_map is not None:
-                assert adj.shape[0] == self.edge_map.max(), \
-                    f'Invalid adjacency list. {self.edge_map.max()} edges are expected.'
-        self._adjacency_list = adj.astype(np.uint32)
+                nb_edges = self.edge_map.max()
+                assert adj.shape[0] == nb_edges, f'Invalid adjacency list. {nb_edges} edges are expected.'
+        self._adjacency_list = adj
+        self._max_node = max_node
 
     @property
     def nodes_coordinates(self) -> np.ndarray:
@@ -335,20 +583,22 @@ class LayerGraph(Layer):
         self._notify_data_change()
 
     def _set_nodes_coordinates(self, node_yx, nodes_domain=None, check_dim=True):
-        node_yx = np.asarray(node_yx)
+        # Single conversion, and a C-contiguous buffer that orjson serializes natively.
+        node_yx = np.ascontiguousarray(node_yx, dtype=np.uint32)
         assert node_yx.ndim == 2 and node_yx.shape[1] == 2, \
             f'Invalid  nodes coordinates shape {node_yx.shape}. Must be (nbNodes, 2).'
         if check_dim:
             if self.adjacency_list is not None:
-                assert node_yx.shape[0] > self.adjacency_list.max(), \
+                max_node = self._max_node
+                assert node_yx.shape[0] > max_node, \
                     f'Invalid nodes coordinates shape {node_yx.shape}. ' \
-                    f'Expected at least {self.adjacency_list.max()+1} nodes but got {node_yx.shape[0]}.'
+                    f'Expected at least {max_node+1} nodes but got {node_yx.shape[0]}.'
         if nodes_domain is None:
             if self.edge_map is not None:
                 nodes_domain = Rect.from_size(self._edge_map.shape)
             elif not Rect.is_empty(self._main_domain):
                 nodes_domain = self._main_domain
-        self._nodes_coordinates = node_yx.astype(np.uint32)
+        self._nodes_coordinates = node_yx
         self._nodes_domain = nodes_domain
 
     @property
@@ -361,23 +611,19 @@ class LayerGraph(Layer):
         self._notify_data_change()
 
     def _set_edge_map(self, edge_label, check_dim=True):
-        if type(edge_label).__qualname__ == 'Tensor':
+        if _is_tensor(edge_label):
             edge_label = edge_label.detach().cpu().numpy()
         if edge_label is not None:
-            error = ValueError(f'Invalid edge map type {edge_label.dtype}. '
-                               f'Must be positive integer encoded on maximum 32 bits.')
-            if edge_label.ndim != 2:
-                raise error
-            elif edge_label.dtype.kind not in '?bBiu':
-                raise error
-            elif np.min(edge_label) < 0 or np.max(edge_label) >= 2 ** 32:
-                raise error
+            if edge_label.ndim != 2 or not _fits_uint32(edge_label):
+                raise ValueError(f'Invalid edge map type {edge_label.dtype}. '
+                                 f'Must be positive integer encoded on maximum 32 bits.')
             if check_dim:
                 if self.adjacency_list is not None:
-                    assert edge_label.max() == self.adjacency_list.shape[0], \
-                        f'Invalid edge label: maximum label is {edge_label.max()} ' \
+                    max_label = edge_label.max()
+                    assert max_label == self.adjacency_list.shape[0], \
+                        f'Invalid edge label: maximum label is {max_label} ' \
                         f'but adjacency list contains{self.adjacency_list.shape[0]} edges.'
-            self._edge_map = edge_label.astype(np.uint32)
+            self._edge_map = edge_label.astype(np.uint32, copy=False)
             if self._nodes_domain is None:
                 self._nodes_domain = Rect.from_size(self._edge_map.shape)
         else:
@@ -440,11 +686,11 @@ class LayerGraph(Layer):
         super().set_main_shape(main_domain, transform_domain)
 
     def _fetch_data(self, resize: Tuple[int, int] | None = None) -> LayerData:
-        data = dict(adj=self._adjacency_list.astype(int).tolist(),
-                    nodes_yx=self.nodes_coordinates.astype(float).tolist())
+        # Arrays are serialized by LayerData.to_json_bytes(), without building intermediate python lists.
+        data = dict(adj=self._adjacency_list, nodes_yx=self._nodes_coordinates)
         if self.edge_map is not None:
             data['edgeMap'] = LayerLabel.encode_label_url(self.edge_map)
-        return LayerData(data=data, infos={'nbNodes': int(self._adjacency_list.max()) + 1,
+        return LayerData(data=data, infos={'nbNodes': self._max_node + 1,
                                            'nodesDomain': self._nodes_domain,})
 
     def _shape(self):
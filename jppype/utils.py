@@ -218,17 +218,18 @@ class Rect(tuple):
 
     def __or__(self, other):
         if isinstance(other, Rect):
-            return Rect.from_points((max(self.y + self.h, other.y + other.h),
-                                     max(self.x + self.w, other.x + other.w)),
-                                    (min(self.y, other.y), min(self.x, other.x)))
+            return Rect.from_points((min(self.y, other.y), min(self.x, other.x)),
+                                    (max(self.y + self.h, other.y + other.h),
+                                     max(self.x + self.w, other.x + other.w)))
         else:
             raise TypeError('Rect can only be combined only with another Rect')
 
     def __and__(self, other):
         if isinstance(other, Rect):
-            return Rect.from_points((min(self.y + self.h, other.y + other.h),
-                                     min(self.x + self.w, other.x + other.w)),
-                                    (max(self.y, other.y), max(self.x, other.x)))
+            y0, x0 = max(self.y, other.y), max(self.x, other.x)
+            # Disjoint rects intersect in an empty rect rather than one of negative size.
+            return Rect.from_points((y0, x0), (max(y0, min(self.y + self.h, other.y + other.h)),
+                                               max(x0, min(self.x + self.w, other.x + other.w))))
         else:
             raise TypeError('Rect can only be combined only with another Rect')
 
@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 # coding: utf-8
-from typing import Dict, Mapping, Literal, Tuple, Iterator
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Mapping, Literal, Tuple, Iterator, Container
 
 # Copyright (c) Gabriel Lepetit-Aimon.
 # Distributed under the terms of the Modified BSD License.
 
 import numpy as np
-import json
 import traitlets
 from ._frontend import BaseI3PWidget, ABCHasTraitMeta
 from .layers_2d import LayerLabel, LayerImage, LayerGraph
@@ -14,6 +16,15 @@ from .layer_base import LayersList, Layer
 from .utils import EventsDispatcher, FlagContext
 
 
+@functools.cache
+def _fetch_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='jppype-fetch')
+
+
+def _fetch_json_bytes(layer: Layer) -> bytes:
+    return layer.get_data().to_json_bytes()
+
+
 class View2D(LayersList, BaseI3PWidget, metaclass=ABCHasTraitMeta):
     _layers_data = traitlets.Dict(key_trait=traitlets.Unicode(), value_trait=traitlets.Bytes()).tag(sync=True, )
     _layers_options = traitlets.Dict(key_trait=traitlets.Unicode(), value_trait=traitlets.Unicode()).tag(sync=True)
@@ -43,10 +54,10 @@ class View2D(LayersList, BaseI3PWidget, metaclass=ABCHasTraitMeta):
             self.__send_all_layers_options()
 
     def _send_delete_layers(self, layers: Iterator[Layer]):
+        deleted = {self.get_layers_alias(layer) for layer in layers}
         with self._transmit:
-            self.__send_all_layers_options()
-            for layer in layers:
-                del self._layers_data[self.get_layers_alias(layer)]
+            self._layers_data = {k: v for k, v in self._layers_data.items() if k not in deleted}
+            self.__send_all_layers_options(exclude=deleted)
 
     def _send_update_layers_options(self, options: Mapping[str, str]):
         with self._transmit:
@@ -54,15 +65,17 @@ class View2D(LayersList, BaseI3PWidget, metaclass=ABCHasTraitMeta):
             self.__send_all_layers_options()
 
     def _send_update_layers_data(self, layers: Iterator[Layer]):
+        layers = list(layers)
         current_data = self._layers_data.copy()
-        for layer in layers:
-            current_data[self.get_layers_alias(layer)] = layer.get_data().to_json_bytes()
+        # Resizing and encoding (numpy, cv2) mostly release the GIL: fetch several layers concurrently.
+        fetch = _fetch_pool().map if len(layers) > 1 else map
+        for layer, data in zip(layers, fetch(_fetch_json_bytes, layers)):
+            current_data[self.get_layers_alias(layer)] = data
         with self._transmit:
             self._layers_data = current_data
 
-    def __send_all_layers_options(self):
-        layers_options = {self.get_layers_alias(layer): json.dumps(layer.options, ensure_ascii=False).encode('utf8')
-                          for layer in self}
+    def __send_all_layers_options(self, exclude: Container[str] = ()):
+        layers_options = {alias: layer.options_json() for alias, layer in self.layers.items() if alias not in exclude}
         with self._transmit:
             self._layers_options = layers_options
             if self.main_layer:
@@ -0,0 +1,182 @@
+import pytest
+
+from jppype.layer_base import Layer, LayerData, LayersList
+from jppype.utils import Rect
+
+
+class DummyLayer(Layer):
+    def __init__(self, shape=(10, 20), layer_type='dummy'):
+        super().__init__(layer_type)
+        self._dummy_shape = shape
+
+    def _fetch_data(self) -> LayerData:
+        return LayerData(b'')
+
+    def update_data(self, data):
+        self._dummy_shape = data
+        self._notify_data_change()
+
+    def _fetch_item(self):
+        return {}
+
+    def _fetch_graphs(self, rect):
+        return {}
+
+    def _shape(self):
+        return self._dummy_shape
+
+
+class DummyLayersList(LayersList):
+    """Layers list recording the notifications it sends."""
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def _send_new_layers(self, layers):
+        self.sent.append(('new', [self.get_layers_alias(l) for l in layers]))
+
+    def _send_delete_layers(self, layers):
+        self.sent.append(('delete', [self.get_layers_alias(l) for l in layers]))
+
+    def _send_update_layers_data(self, layers):
+        self.sent.append(('data', sorted(self.get_layers_alias(l) for l in layers)))
+
+    def _send_update_layers_options(self, layers_options):
+        self.sent.append(('options', sorted(self.get_layers_alias(l) for l in layers_options)))
+
+
+def test_top_z_index_after_lowering_top_layer():
+    layers = DummyLayersList()
+    a, b, c = DummyLayer(), DummyLayer(), DummyLayer()
+    layers.add_layer(a, 'a')
+    layers.add_layer(b, 'b')
+    assert (a.z_index, b.z_index) == (1, 2)
+
+    b.z_index = 0
+    layers.add_layer(c, 'c')
+    assert c.z_index == 2
+
+    c.z_index = 5
+    layers.add_layer(DummyLayer(), 'd')
+    assert layers['d'].z_index == 6
+
+
+def test_auto_alias_reuses_freed_numbers():
+    layers = DummyLayersList()
+    for _ in range(3):
+        layers.add_layer(DummyLayer(layer_type='image'))
+    assert layers.layers_alias == ('Image 01', 'Image 02', 'Image 03')
+
+    layers.remove_layer('Image 01')
+    layers.add_layer(DummyLayer(layer_type='image'))
+    assert 'Image 01' in layers
+
+    layers.remove_layers(['Image 02', 'Image 03'])
+    layers.add_layer(DummyLayer(layer_type='image'), 'Image 03')
+    layers.add_layer(DummyLayer(layer_type='image'))
+    layers.add_layer(DummyLayer(layer_type='image'))
+    assert sorted(layers.layers_alias) == ['Image 01', 'Image 02', 'Image 03', 'Image 04']
+    layers.add_layer(DummyLayer(layer_type='label'))
+    assert 'Label 01' in layers
+
+
+def test_layers_domain_cache():
+    layers = DummyLayersList()
+    layers.add_layer(DummyLayer((10, 20)), 'a')
+    layers.add_layer(DummyLayer((5, 5)), 'b', domain=Rect(4, 4, 20, 30))
+    domain = layers.layers_domain()
+    assert domain == Rect(24, 34, 0, 0)
+    assert layers.layers_domain() is domain
+
+    # Invalidated by a domain change, an added layer or a removed layer.
+    layers['b'].domain = Rect(4, 4, 2, 3)
+    assert layers.layers_domain() == Rect(10, 20, 0, 0)
+    layers.add_layer(DummyLayer((3, 3)), 'c', domain=Rect(2, 2, -5, -5))
+    assert layers.layers_domain() == Rect(15, 25, -5, -5)
+    layers.remove_layer('c')
+    assert layers.layers_domain() == Rect(10, 20, 0, 0)
+
+
+class OtherLayer(DummyLayer):
+    def __init__(self):
+        super().__init__(layer_type='other')
+
+
+def test_get_layers_selection():
+    layers = DummyLayersList()
+    a, b, c = DummyLayer(), DummyLayer(), OtherLayer()
+    layers.add_layer(a, 'a')
+    layers.add_layer(b, 'b')
+    layers.add_layer(c, 'c')
+    b.visible = False
+
+    # By alias, layer, iterable of aliases and layers, or predicate
+    assert layers.get_layers('b') == [b]
+    assert layers.get_layers(c) == [c]
+    assert layers.get_layers(['c', a]) == [c, a]
+    assert layers.get_layers(lambda name, layer: name != 'a') == [b, c]
+    with pytest.raises(ValueError):
+        layers.get_layers('d')
+
+    # By type name, class, or a tuple of them
+    assert layers.get_layers(None, layer_type='dummy') == [a, b]
+    assert layers.get_layers(None, layer_type=OtherLayer) == [c]
+    assert layers.get_layers(None, layer_type=('other', 'dummy')) == [a, b, c]
+    assert layers.get_layers(['a', 'c'], layer_type='other') == [c]
+
+    # Combined with visibility and z_index ordering
+    a.z_index = 10
+    assert layers.get_layers(None, only_visible=True, sort_zindex=True) == [c, a]
+    assert layers.get_layers(None, only_visible=True, layer_type='dummy') == [a]
+    assert layers.get_layers_alias(None, sort_zindex=True) == ['b', 'c', 'a']
+
+
+def test_update_lock_batches_notifications():
+    layers = DummyLayersList()
+    for alias in 'abc':
+        layers.add_layer(DummyLayer(), alias)
+    layers.sent.clear()
+
+    with layers._update_lock:
+        layers['a'].opacity = .5
+        layers['b'].update_data((4, 4))
+        with layers._update_lock:
+            layers['a'].update_data((3, 3))
+            layers['b'].z_index = 10
+        layers['a'].visible = False
+        layers['b'].update_data((5, 5))
+        assert layers.sent == []
+
+    # One data and one options notification, each layer listed once.
+    assert layers.sent == [('data', ['a', 'b']), ('options', ['a', 'b'])]
+
+    layers.update_options({'c': {'opacity': .2}, 'a': {'label': 'A'}})
+    assert layers.sent[2:] == [('options', ['a', 'c'])]
+
+
+def test_remove_layers():
+    layers = DummyLayersList()
+    a, b, c, d = DummyLayer((10, 20)), DummyLayer((5, 5)), OtherLayer(), DummyLayer((4, 4))
+    layers.add_layer(a, 'a')
+    layers.add_layer(b, 'b', domain=Rect(5, 5, 20, 30))
+    layers.add_layer(c, 'c', domain=Rect(3, 3, 1, 1))
+    layers.add_layer(d, 'd', domain=Rect(4, 4, 2, 2))
+    assert layers.main_layer is a
+    assert layers.layers_domain() == Rect(25, 35, 0, 0)
+    layers.sent.clear()
+
+    layers.remove_layers(['a', b, 'd'])
+    # A single deletion notification (the main layer change also updates the other layers' options).
+    assert [sent for sent in layers.sent if sent[0] == 'delete'] == [('delete', ['a', 'b', 'd'])]
+    assert layers.main_layer is c
+    assert layers.layers_alias == ('c',)
+    assert list(layers.layers) == ['c']
+    assert layers._alias_by_uuid == {c.uuid: 'c'}
+    assert layers.get_layers(None, layer_type='dummy') == []
+    assert layers.get_layers(None, layer_type='other') == [c]
+    assert layers.get_layers(None, only_visible=True) == [c]
+    assert layers.layers_domain() == c.domain
+
+    # The next layer is stacked right above the remaining one.
+    layers.add_layer(DummyLayer(), 'e')
+    assert layers['e'].z_index == c.z_index + 1
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+
+import numpy as np
+import pytest
+
+from jppype.layers_2d import LayerImage, LayerLabel
+
+
+def test_duplicate_fetch_concurrently():
+    rng = np.random.default_rng(0)
+    layer = LayerImage(rng.random((64, 96)))
+    duplicate = copy(layer)
+    assert duplicate._fetch_cache is not layer._fetch_cache
+
+    # More distinct sizes than cached entries, so both layers keep evicting while the other one is fetching.
+    sizes = [(s, s) for s in range(8, 40, 2)] * 4
+    expected = {s: layer._encode_data(s).data for s in sizes}
+
+    def fetch_all(lyr):
+        return [lyr.get_data(resize=s).data for s in sizes]
+
+    # As View2D does, each layer is fetched by a single thread of the pool.
+    with ThreadPoolExecutor(2) as pool:
+        for data in pool.map(fetch_all, (layer, duplicate)):
+            assert data == [expected[s] for s in sizes]
+    assert len(layer._fetch_cache) <= 8 and len(duplicate._fetch_cache) <= 8
+
+
+def test_duplicate_label_has_own_cache():
+    layer = LayerLabel(np.arange(12, dtype=np.uint8).reshape(3, 4))
+    layer.get_data()
+    duplicate = copy(layer)
+    assert duplicate._fetch_cache == {}
+    assert duplicate.get_data().data == layer.get_data().data
+
+
+def test_encode_format():
+    layer = LayerImage(np.zeros((4, 6, 3), dtype=np.uint8))
+    assert layer.get_data().data.startswith('data:image/webp;')
+    layer.encode_format = 'jpg'
+    assert layer.get_data().data.startswith('data:image/jpg;')
+
+
+def test_encode_large_image_as_jpeg():
+    # WebP images are limited to 16383 pixels in width and height.
+    layer = LayerImage(np.zeros((20, 16384), dtype=np.uint8))
+    assert layer.get_data().data.startswith('data:image/jpg;')
+    assert layer.get_data(resize=(1024, 1024)).data.startswith('data:image/webp;')
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.uint16, np.int64, np.float64])
+@pytest.mark.parametrize('vmin, vmax, expected', [
+    (51, 255, [0, 0, 61, 191]),             # Shifted by vmin, then [vmin, vmax] is mapped to [0, 255]
+    (None, 102, [0, 100, 250, 255]),        # Not shifted, scaled by 255 / vmax and saturated
+    (None, None, [0, 40, 100, 204]),        # Neither shifted nor scaled
+    ('auto', 'auto', [0, 50, 125, 255]),    # Small minimum: vmin is 0 and vmax the image maximum
+])
+def test_encoded_image_values(monkeypatch, dtype, vmin, vmax, expected):
+    monkeypatch.setattr(LayerImage, 'encode_url', staticmethod(lambda img, format: img))
+    layer = LayerImage(np.array([[0, 40, 100, 204]], dtype=dtype), vmin=vmin, vmax=vmax)
+    img = layer.get_data().data
+    assert img.dtype == np.uint8
+    assert img.tolist() == [expected]
+
+
+def test_encoded_channels_order(monkeypatch, tmp_path):
+    import cv2
+    monkeypatch.setattr(LayerImage, 'encode_url', staticmethod(lambda img, format: img))
+    bgr = np.zeros((2, 3, 3), dtype=np.uint8)
+    bgr[..., 2] = 255
+
+    # Arrays are RGB, they are reordered to BGR for cv2.imencode.
+    layer = LayerImage(bgr[..., ::-1].copy(), vmin=None, vmax=None)
+    assert np.array_equal(layer.get_data().data, bgr)
+
+    # Images loaded from a file keep OpenCV's BGR order.
+    path = str(tmp_path / 'red.png')
+    cv2.imwrite(path, bgr)
+    layer = LayerImage(path, vmin=None, vmax=None)
+    assert np.array_equal(layer.image, bgr)
+    assert np.array_equal(layer.get_data().data, bgr)
+
+
+def test_assign_scalar_image(monkeypatch):
+    monkeypatch.setattr(LayerImage, 'encode_url', staticmethod(lambda img, format: img))
+    layer = LayerImage(np.zeros((3, 4)), vmin=0, vmax=1)
+    layer.image = 0.2
+    assert layer.shape == (3, 4)
+    assert layer.image.shape == (3, 4)
+    assert np.all(layer.get_data().data == 51)
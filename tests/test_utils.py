@@ -0,0 +1,22 @@
+import pytest
+
+from jppype.utils import Rect
+
+
+@pytest.mark.parametrize('a, b, union, intersection', [
+    # Overlapping
+    (Rect(10, 10, 0, 0), Rect(10, 10, 5, 5), Rect(15, 15, 0, 0), Rect(5, 5, 5, 5)),
+    # Disjoint
+    (Rect(2, 3, 0, 0), Rect(4, 2, 10, 20), Rect(14, 22, 0, 0), Rect(0, 0, 10, 20)),
+    # Contained
+    (Rect(10, 20, 0, 0), Rect(2, 4, 3, 5), Rect(10, 20, 0, 0), Rect(2, 4, 3, 5)),
+])
+def test_rect_union_intersection(a, b, union, intersection):
+    assert a | b == union
+    assert b | a == union
+    assert a & b == intersection
+    assert b & a == intersection
+
+
+def test_rect_disjoint_intersection_is_empty():
+    assert (Rect(2, 3, 0, 0) & Rect(4, 2, 1, 20)).is_self_empty()